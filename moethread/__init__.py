@@ -2,3 +2,9 @@ from .version import __version__
 from .version import __copyright__
 from .version import __author__
 from .main import parallel_call, progress, format_time, format_latency, mtdo, mtdo_from_csv, mtdo_from_json
+from .main import Job, shared_pool, current_job, format_size
+from .pipeline import Pipeline, Stage
+from .cache import ResultCache, item_key
+from .coordinator import Coordinator
+from .resources import ResourcePool
+from .profiler import JobProfile
@@ -0,0 +1,128 @@
+import time, json
+import pickle, sqlite3
+import hashlib, threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def item_key(data: Dict) -> str:
+    """Default cache key, a sha1 digest of the item's `data` dict."""
+    try:
+        raw = json.dumps(data, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        raw = repr(sorted(data.items(), key=lambda kv: str(kv[0])))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Two tier result cache for `parallel_call` jobs.
+
+    Results live in an in-memory LRU and, when `path` is given, in a SQLite file that survives across runs.
+    Disk entries older than `max_age` seconds are treated as misses and dropped, and the least recently used
+    entries are dropped once the file holds more than `max_entries` results.
+
+    Args:
+        path (str, optional): SQLite file for the persistent tier, empty keeps results in memory only. Defaults to ''.
+        max_items (int, optional): capacity of the in-memory LRU. Defaults to 4096.
+        max_entries (int, optional): capacity of the persistent tier, 0 means unbounded. Defaults to 0.
+        max_age (float, optional): seconds before a cached result expires, 0 means never. Defaults to 0.
+        key (Callable, optional): maps an item's `data` dict to its cache key. Defaults to `item_key`.
+    """
+    _EVICT_EVERY = 256
+
+    def __init__(self, path: str='', max_items: int=4096, max_entries: int=0, max_age: float=0,
+                 key: Optional[Callable[[Dict], str]]=None):
+        self.path = path
+        self.max_items = max_items
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.key = key or item_key
+        self._memory: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS results "
+                             "(key TEXT PRIMARY KEY, value BLOB, created REAL, accessed REAL)")
+            self.evict()
+
+    def _expired(self, created: float) -> bool:
+        return self.max_age > 0 and time.time() - created > self.max_age
+
+    def _remember(self, key: str, created: float, value: Any):
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Looks up `key`, returns a (hit, value) tuple."""
+        with self._lock:
+            if key in self._memory:
+                created, value = self._memory[key]
+                if not self._expired(created):
+                    self._memory.move_to_end(key)
+                    return True, value
+                del self._memory[key]
+            if self._db is None:
+                return False, None
+            row = self._db.execute("SELECT value, created FROM results WHERE key=?", (key,)).fetchone()
+            if row is None:
+                return False, None
+            if self._expired(row[1]):
+                self._db.execute("DELETE FROM results WHERE key=?", (key,))
+                return False, None
+            try:
+                value = pickle.loads(row[0])
+            except Exception:
+                return False, None
+            self._db.execute("UPDATE results SET accessed=? WHERE key=?", (time.time(), key))
+            self._remember(key, row[1], value)
+            return True, value
+
+    def set(self, key: str, value: Any):
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._db is None:
+                return
+            try:
+                blob = pickle.dumps(value)
+            except Exception:
+                return # unpicklable results only live in memory...
+            self._db.execute("INSERT OR REPLACE INTO results (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                             (key, blob, now, now))
+            self._writes += 1
+            if self._writes % self._EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self):
+        if self.max_age > 0:
+            self._db.execute("DELETE FROM results WHERE created < ?", (time.time() - self.max_age,))
+        if self.max_entries > 0:
+            self._db.execute("DELETE FROM results WHERE key IN (SELECT key FROM results "
+                             "ORDER BY accessed DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def evict(self):
+        """Drops expired and least recently used entries from the persistent tier."""
+        with self._lock:
+            if self._db is not None:
+                self._evict()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._evict()
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._db is None:
+                return len(self._memory)
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
@@ -0,0 +1,132 @@
+import os, time, json
+import socket, sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class Coordinator:
+    """Hands out batches of a job to independent worker processes through a SQLite lease table.
+
+    Every worker calls the same `parallel_call` function on the same data with a `Coordinator` pointing at the same
+    file. Workers claim batches one at a time and keep their leases alive with a heartbeat, so the batches of a worker
+    that died are handed out again once its leases expire. A worker only returns once every batch is done.
+    SQLite needs working file locks, which some network filesystems don't provide.
+
+    The file keeps describing its job once every batch is done: running a different job on it fails the data check,
+    and rerunning the same job returns right away. Call `reset()` or delete the file before reusing it.
+
+    Args:
+        path (str): SQLite file shared by all workers.
+        batch_size (int, optional): number of items per batch. Defaults to 1000.
+        lease (float, optional): seconds a claimed batch stays reserved without a heartbeat. Defaults to 60.
+        worker (str, optional): identifier of this worker. Defaults to `hostname:pid`.
+    """
+    def __init__(self, path: str, batch_size: int=1000, lease: float=60, worker: str=''):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.lease = lease
+        self.worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+        self.claimed = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=max(30, lease), isolation_level=None, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS batches (id INTEGER PRIMARY KEY, start INTEGER, stop INTEGER, "
+                         "owner TEXT, expires REAL, done INTEGER DEFAULT 0)")
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def open(self, total: int, fingerprint: str=''):
+        """Creates the batches of a `total` items job, or joins the job another worker already created."""
+        with self._transaction() as db:
+            row = db.execute("SELECT value FROM meta WHERE key='job'").fetchone()
+            job = f"{total}:{fingerprint}"
+            if row is None:
+                db.execute("INSERT INTO meta (key, value) VALUES ('job', ?)", (job,))
+                db.executemany("INSERT INTO batches (start, stop) VALUES (?, ?)",
+                               [(i, min(i + self.batch_size, total)) for i in range(0, total, self.batch_size)])
+            elif row[0] != job:
+                raise ValueError(f"coordinator [{self.path}] belongs to a different job, "\
+                                 f"all workers must be given the same data")
+        if self._heartbeat is None:
+            self._stop.clear()
+            self._heartbeat = threading.Thread(target=self._renew, daemon=True)
+            self._heartbeat.start()
+
+    def share(self, name: str, items: List) -> List:
+        """Returns the list stored under `name` by the first worker to get here, storing `items` if there is none yet.
+
+        Useful when workers can't rebuild the same inputs themselves, e.g. once files have been moved away by others.
+        """
+        with self._transaction() as db:
+            row = db.execute("SELECT value FROM meta WHERE key=?", (f"items:{name}",)).fetchone()
+            if row is None:
+                db.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (f"items:{name}", json.dumps(items)))
+                return items
+        return json.loads(row[0])
+
+    def reset(self):
+        """Forgets the job along with its batches, so the file can be reused. Only call it while no worker is running."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM batches")
+            db.execute("DELETE FROM meta")
+        self.claimed = 0
+
+    def claim(self) -> Optional[Tuple[int, int, int]]:
+        """Returns the (id, start, stop) of the next free batch, None once every batch is done.
+
+        While other workers still hold the last batches, this waits in case one of them dies and its batches free up.
+        """
+        while True:
+            now = time.time()
+            with self._transaction() as db:
+                row = db.execute("SELECT id, start, stop FROM batches WHERE done=0 AND (owner IS NULL OR expires < ?) "
+                                 "ORDER BY id LIMIT 1", (now,)).fetchone()
+                if row is not None:
+                    db.execute("UPDATE batches SET owner=?, expires=? WHERE id=?", (self.worker, now + self.lease, row[0]))
+                    self.claimed += 1
+                    return row
+                left = db.execute("SELECT COUNT(*) FROM batches WHERE done=0").fetchone()[0]
+            if not left:
+                return None
+            time.sleep(min(self.lease / 4, 5))
+
+    def complete(self, batch_id: int):
+        with self._transaction() as db:
+            db.execute("UPDATE batches SET done=1 WHERE id=?", (batch_id,))
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM batches WHERE done=0").fetchone()[0]
+
+    def _renew(self):
+        while not self._stop.wait(self.lease / 3):
+            with self._transaction() as db:
+                db.execute("UPDATE batches SET expires=? WHERE owner=? AND done=0", (time.time() + self.lease, self.worker))
+
+    def leave(self):
+        """Stops the heartbeat and hands unfinished batches of this worker back to the others."""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+        with self._transaction() as db:
+            db.execute("UPDATE batches SET owner=NULL, expires=NULL WHERE owner=? AND done=0", (self.worker,))
+
+    def close(self):
+        self.leave()
+        with self._lock:
+            self._db.close()
@@ -24,17 +24,33 @@
 import time, os, sys
 import csv, json
 import math, shutil
+import errno, threading
 from copy import deepcopy
-from itertools import islice
-from typing import Dict, List
+from contextlib import contextmanager, nullcontext
+from itertools import islice, count
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from pathlib import Path
 from glob import glob
+from fnmatch import fnmatch
 from moecolor import print
 from moecolor import FormatText as ft
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Executor, Future
+from .cache import ResultCache, item_key
+from .profiler import JobProfile, switch
 
-GLOBAL_COUNT = 0
-STDOUT = None
+_SHARED_POOL: Optional[ThreadPoolExecutor] = None
+_SHARED_POOL_LOCK = threading.Lock()
+_SHARED_POOL_SIZE = 0
+_WATCH_INTERVAL = 0.05
+_HEDGE_MIN_SAMPLES = 20
+_LATENCY_WINDOW = 1000
+_COPY_BUFFER = 8 << 20
+_TEARDOWN_TIMEOUT = 30
+_DELETE_MAX_FDS = 128
+_STALE: Dict[int, List[Tuple[Callable, Any, Any]]] = {}
+_STALE_LOCK = threading.Lock()
+_local = threading.local()
 
 ################## HELPER FUNCTIONS START... ##################
 def _chunk_dict(in_dict: Dict, size: int=5000):
@@ -45,7 +61,8 @@ def _chunk_dict(in_dict: Dict, size: int=5000):
 def _chunk_list(in_list, size: int=5000):
     return [in_list[i:i + size] for i in range(0, len(in_list), size)]
 
-def _chunk_data(data: Dict, size: int, chunked_data: List=[]):
+def _chunk_data(data: Dict, size: int, chunked_data: Optional[List]=None):
+    chunked_data = [] if chunked_data is None else chunked_data
     chunked_dict = {}
     for k, v in data.items():
         chunked_dict[k] = _chunk_list(v, size)
@@ -75,22 +92,393 @@ def _csv_to_dict(csv_file):
 ################## HELPER FUNCTIONS END.... ##################
 
 
-def func_status(func):
-    def _wrapper(*args, **kwargs):
-        global STDOUT, GLOBAL_COUNT
-        _verbose = kwargs.get('verbose')
-        if _verbose is not None and _verbose in [0, -1, False, 'false']:
-            STDOUT = sys.stdout
-            sys.stdout = None
-        print('********************* MultiThreading Start *********************', color='#FFFF99')
-        result = func(*args, **kwargs)
-        print('********************* MultiThreading End *********************', color='#FFFF99')
-        # Reset some globals after completing job...
-        GLOBAL_COUNT = 0
-        if STDOUT is not None:
-            sys.stdout = STDOUT
-        return result
-    return _wrapper
+def _is_verbose(verbose) -> bool:
+    return verbose is None or verbose not in [0, -1, False, 'false']
+
+class _NullWriter:
+    """Output sink for quiet jobs, swallows everything written to it."""
+    def write(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
+def current_job() -> Optional['Job']:
+    """Returns the job the calling worker thread is running an item for, None outside of a job."""
+    return getattr(_local, 'job', None)
+
+def shared_pool(max_workers: int=32) -> ThreadPoolExecutor:
+    """Returns the process-wide worker pool, creating it on first use.
+
+    Args:
+        max_workers (int, optional): number of worker threads in the pool, only honored on first call. Defaults to 32.
+    """
+    global _SHARED_POOL, _SHARED_POOL_SIZE
+    with _SHARED_POOL_LOCK:
+        if _SHARED_POOL is None:
+            _SHARED_POOL = ThreadPoolExecutor(max_workers, thread_name_prefix='moethread')
+            _SHARED_POOL_SIZE = max_workers
+        return _SHARED_POOL
+
+def _settle(pool: Optional[Executor]=None, hops: int=0):
+    """Tears down the resources finished jobs left on the calling thread of a shared pool.
+
+    Given a `pool`, a thread with nothing to tear down passes the turn on, at most `hops` times, without waiting.
+    """
+    if not _STALE:
+        return
+    with _STALE_LOCK:
+        stale = _STALE.pop(threading.get_ident(), ())
+        left = bool(_STALE)
+    for teardown, value, job in stale:
+        try:
+            teardown(value)
+        except Exception as e:
+            job.print(f"[  WARN  ] teardown failed: {e}.", color='orange')
+    if not stale and left and pool is not None and hops > 0:
+        pool.submit(_settle, pool, hops - 1)
+        time.sleep(0.001) # lets an idle thread pick the turn up instead of this one...
+
+class _Task:
+    """One item of a job, along with its live attempts."""
+    __slots__ = ('data', 'key', 'call', 'live', 'failures', 'hedged', 'done')
+
+    def __init__(self, data: Dict, key: Optional[str], call: Tuple):
+        self.data = data
+        self.key = key
+        self.call = call
+        self.live: Dict[int, Optional[float]] = {} # attempt id -> start time, None while queued...
+        self.failures = 0
+        self.hedged = False
+        self.done = False
+
+class Job:
+    """Holds the state of a single `parallel_call` run.
+
+    Each job owns its counters, timer and output sink, so several jobs can run at the same time
+    from different threads without corrupting each other's progress or silencing each other's output.
+
+    Args:
+        total (int): number of items the job is going to process.
+        threads (int): maximum number of items the job may have in flight at once.
+        verbose (bool, optional): whether to write job status to stdout. Defaults to True.
+        pool (Executor, optional): executor to run items on. When shared between jobs, each job is capped to `threads`
+                                   in-flight items, which the caller keeps at most the pool's size, so jobs take turns on the pool.
+                                   Defaults to a private pool.
+        cache (ResultCache, optional): cache consulted before running an item and filled after. Defaults to None.
+        timeout (float, optional): seconds an attempt may run before it counts as failed, 0 disables it. Time spent queued
+                                   for a worker doesn't count. A timed out attempt keeps its worker busy until it returns,
+                                   but the job stops waiting for it. Defaults to 0.
+        deadline (float, optional): seconds the whole job may run, unfinished items are dropped after it, 0 disables it. Defaults to 0.
+        retries (int, optional): extra attempts given to failed or timed out items. Defaults to 0.
+        backoff (float, optional): delay before the first retry, doubled on every following one. Defaults to 0.
+        hedge (bool | float, optional): launch a second attempt of items running past this latency quantile of the
+                                        items finished so far, `True` means the 95th percentile. Defaults to False.
+        init (Callable, optional): builds per-thread resources once per worker thread. A returned dict is merged into the
+                                   kwargs of every call made from that thread, anything else is passed as `resource`. Defaults to None.
+        teardown (Callable, optional): called with each value returned by `init` once the job is done, on the thread that
+                                       built it, so thread-bound resources such as sqlite connections can be closed. On a shared
+                                       pool this happens once the thread is free, possibly after the job returned. On a private
+                                       pool, values still in use by abandoned attempts are left alone. Defaults to None.
+        profiler (JobProfile, optional): profiles every thread taking part in the job. Defaults to None.
+    """
+    def __init__(self, total: int, threads: int, verbose: bool=True, pool: Optional[Executor]=None,
+                 cache: Optional[ResultCache]=None, timeout: float=0, deadline: float=0, retries: int=0,
+                 backoff: float=0, hedge: Union[bool, float]=False, init: Optional[Callable]=None,
+                 teardown: Optional[Callable]=None, profiler: Optional[JobProfile]=None):
+        self.total = total
+        self.threads = threads
+        self.cache = cache
+        self.timeout = timeout
+        self.deadline = deadline
+        self.retries = retries
+        self.backoff = backoff
+        self.hedge = 0.95 if hedge is True else float(hedge or 0)
+        self.init = init
+        self.teardown = teardown
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.start()
+        self.count = 0
+        self.nbytes = 0
+        self.hits = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.hedges = 0
+        self.dropped = 0
+        self.deferred = 0
+        self.cache_errors = 0
+        self.error: Optional[BaseException] = None
+        self.cache_error: Optional[BaseException] = None
+        self.latencies = deque(maxlen=_LATENCY_WINDOW)
+        self.st = time.perf_counter()
+        self.stdout = sys.stdout if _is_verbose(verbose) else _NullWriter()
+        self._own_pool = pool is None
+        self.pool = ThreadPoolExecutor(threads) if pool is None else pool
+        self._slots = threading.BoundedSemaphore(threads)
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._tasks: Set[_Task] = set()
+        self._futures: Dict[int, Future] = {}
+        self._ids = count()
+        self._local = threading.local()
+        self._resources: Dict[int, Any] = {}
+        self._running: Dict[int, int] = {}
+        self._closed = threading.Event()
+        self._watcher = None
+        if self.timeout > 0 or self.hedge > 0:
+            self._watcher = threading.Thread(target=self._watch, daemon=True)
+            self._watcher.start()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.st
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline > 0 and self.elapsed > self.deadline
+
+    def print(self, text: str='', **kwargs):
+        print(text, file=self.stdout, **kwargs)
+
+    def add_bytes(self, n: int):
+        """Adds `n` to the bytes shown in the progress line."""
+        with self._lock:
+            self.nbytes += n
+
+    def step(self, n: int=1):
+        with self._lock:
+            self.count += n
+            progress(self.count, self.total, self.st, stdout=self.stdout, nbytes=self.nbytes)
+
+    def resources(self) -> Dict:
+        """Returns the calling thread's resources, building them with `init` on first use."""
+        if self.init is None:
+            return {}
+        resources = getattr(self._local, 'resources', None)
+        if resources is None:
+            value = self.init()
+            resources = value if isinstance(value, dict) else {'resource': value}
+            self._local.resources = resources
+            with self._lock:
+                self._resources[threading.get_ident()] = value
+        return resources
+
+    def launch(self, task: _Task) -> bool:
+        """Starts the first attempt of `task` once a slot frees up, returns False if the deadline passed first."""
+        if self.deadline > 0:
+            acquired = False
+            while not acquired:
+                if self.expired:
+                    return False
+                acquired = self._slots.acquire(timeout=_WATCH_INTERVAL)
+            if self.expired:
+                self._slots.release()
+                return False
+        else:
+            self._slots.acquire()
+        with self._lock:
+            self._tasks.add(task)
+        self._attempt(task)
+        return True
+
+    def _attempt(self, task: _Task):
+        fn, args, kwargs = task.call
+        with self._lock:
+            if task.done or self._closed.is_set():
+                return
+            aid = next(self._ids)
+            task.live[aid] = None
+        future = self.pool.submit(fn, self, task, aid, *args, **kwargs)
+        with self._lock:
+            self._futures[aid] = future
+        future.add_done_callback(lambda _: self._forget(aid))
+
+    def _forget(self, aid: int):
+        with self._lock:
+            self._futures.pop(aid, None)
+
+    def begin(self, task: _Task, aid: int) -> bool:
+        """Starts the clock of an attempt once a worker picks it up, returns False if it is no longer needed."""
+        with self._lock:
+            if task.done or aid not in task.live:
+                return False
+            task.live[aid] = time.perf_counter()
+            return True
+
+    @contextmanager
+    def running(self):
+        """Marks the calling thread as busy in the user function, its resources are in use until it returns."""
+        ident = threading.get_ident()
+        with self._lock:
+            self._running[ident] = self._running.get(ident, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._running[ident] -= 1
+
+    def defer(self):
+        """Takes the calling thread's item out of this job's progress, for items handed off to another job."""
+        self._local.deferred = True
+
+    def finish(self, task: _Task, aid: int, latency: Optional[float]=None, hit: bool=False, failed: bool=False,
+               deferred: bool=False) -> bool:
+        """Marks `task` as done, only the first attempt to get here counts."""
+        with self._lock:
+            task.live.pop(aid, None)
+            if task.done:
+                return False
+            task.done = True
+            self._tasks.discard(task)
+            # Other attempts still waiting for a worker aren't needed anymore...
+            queued = [self._futures.get(other) for other, started in task.live.items() if started is None]
+            if latency is not None:
+                self.latencies.append(latency)
+            self.hits += hit
+            self.failed += failed
+            if deferred:
+                self.deferred += 1
+                self.total -= 1
+            else:
+                self.count += 1
+            progress(self.count, self.total, self.st, stdout=self.stdout, nbytes=self.nbytes)
+            self._cond.notify_all()
+        self._slots.release()
+        for future in queued:
+            if future is not None:
+                future.cancel()
+        return True
+
+    def fail(self, task: _Task, aid: int, error: BaseException):
+        """Records a failed attempt, then retries `task` or gives up on it."""
+        with self._lock:
+            if task.done or task.live.pop(aid, None) is None:
+                return
+            task.failures += 1
+            self.error = error
+            retry = task.failures <= self.retries
+            if not retry and task.live:
+                return # a hedged attempt is still running...
+        if not retry:
+            self.finish(task, aid, failed=True)
+        elif self.backoff > 0:
+            delay = self.backoff * 2 ** (task.failures - 1)
+            timer = threading.Timer(delay, self._attempt, args=(task,))
+            timer.daemon = True
+            timer.start()
+        else:
+            self._attempt(task)
+
+    def _hedge_after(self) -> Optional[float]:
+        if self.hedge <= 0 or len(self.latencies) < _HEDGE_MIN_SAMPLES:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[int(self.hedge * (len(latencies) - 1))]
+
+    def _watch(self):
+        while not self._closed.wait(_WATCH_INTERVAL):
+            now = time.perf_counter()
+            with self._lock:
+                hedge_after = self._hedge_after()
+                running = [(task, aid, started) for task in self._tasks
+                           for aid, started in task.live.items() if started is not None]
+            for task, aid, started in running:
+                if self.timeout > 0 and now - started > self.timeout:
+                    with self._lock:
+                        self.timeouts += 1
+                    self.fail(task, aid, TimeoutError(f"item timed out after {format_time(self.timeout)}"))
+                elif hedge_after is not None and not task.hedged and now - started > hedge_after:
+                    with self._lock:
+                        task.hedged = True
+                        self.hedges += 1
+                    self._attempt(task)
+
+    def join(self) -> bool:
+        """Waits for launched items to finish, returns False if the deadline passed first."""
+        with self._cond:
+            while self._tasks:
+                if self.deadline > 0:
+                    remaining = self.deadline - self.elapsed
+                    if remaining <= 0:
+                        self.dropped += len(self._tasks)
+                        return False
+                    self._cond.wait(min(remaining, _WATCH_INTERVAL))
+                else:
+                    self._cond.wait()
+        return True
+
+    def close(self):
+        self._closed.set()
+        if self._watcher is not None:
+            self._watcher.join()
+        with self._lock:
+            abandoned = list(self._futures.values())
+        hung = [future for future in abandoned if not future.cancel() and not future.done()]
+        if self.profiler is not None:
+            self.profiler.stop()
+        self._teardown()
+        if self._own_pool:
+            # Don't hang on attempts the job already gave up on...
+            self.pool.shutdown(wait=not hung)
+
+    def _teardown(self):
+        """Runs `teardown` on the worker threads that built the resources, some of them can't be used from other threads."""
+        with self._lock:
+            values, self._resources = self._resources, {}
+            busy = [ident for ident in values if self._running.get(ident)]
+        if self.teardown is None or not values:
+            return
+        if not self._own_pool:
+            # Threads of a shared pool may be busy with other jobs, so each one tears down what it owns when it gets
+            # to one of these turns or its next item, whichever comes first, rather than holding up this job...
+            with _STALE_LOCK:
+                for ident, value in values.items():
+                    _STALE.setdefault(ident, []).append((self.teardown, value, self))
+            for _ in range(len(values)):
+                self.pool.submit(_settle, self.pool, self.threads + len(values))
+            return
+        for ident in busy:
+            del values[ident]
+        if busy:
+            self.print(f"[  WARN  ] {len(busy)} resource(s) not torn down, still in use by abandoned attempts.", color='orange')
+        if not values:
+            return
+        done = threading.Event()
+        futures: List[Future] = []
+        owners = [len(values)]
+
+        def _turn():
+            with self._lock:
+                owner = threading.get_ident() in values
+                value = values.pop(threading.get_ident(), None)
+            if owner:
+                try:
+                    self.teardown(value)
+                except Exception as e:
+                    self.print(f"[  WARN  ] teardown failed: {e}.", color='orange')
+                with self._lock:
+                    owners[0] -= 1
+                    if not owners[0]:
+                        done.set()
+            elif not done.is_set():
+                # Pass the turn on, holding this private thread so another worker picks it up...
+                try:
+                    futures.append(self.pool.submit(_turn))
+                except RuntimeError:
+                    pass
+            done.wait()
+
+        futures.extend(self.pool.submit(_turn) for _ in range(len(values)))
+        if not done.wait(_TEARDOWN_TIMEOUT):
+            with self._lock:
+                left = owners[0]
+                values.clear()
+            self.print(f"[  WARN  ] {left} resource(s) not torn down, their worker threads stayed busy.", color='orange')
+        done.set()
+        for future in list(futures):
+            future.cancel()
 
 def format_time(seconds):
     hours, remainder = divmod(seconds, 3600)
@@ -112,51 +500,122 @@ def format_latency(time_item):
         latency = f"{time_item:0.2f} s/item"
     return latency
 
-def progress(count, total, st, return_str=False):
-        # This is like mutex...
-        global GLOBAL_COUNT
-        if count < GLOBAL_COUNT:
-            return
-        elapsed_time = time.perf_counter() - st
-        completed = count / total
-        completed_percent = completed * 100
-        eta = (100.0 * elapsed_time)/ completed_percent -  elapsed_time
-        latency = format_latency(elapsed_time/count)
-        eta_str = f'ETA: {format_time(eta)}'
-        elt_str = f'Elapsed-time: {format_time(elapsed_time)}'
-        msg = f"\r[ STATUS ] Progress: {completed:0.2%} | Processed: {count}/{total} | " \
-              f"{elt_str} | {eta_str} ~ {count/elapsed_time:0.1f} items/s @ {latency}"
-        if return_str:
-            if count >= total:
-                GLOBAL_COUNT = 0
-            return msg
-        else:
-            sys.stdout.write(ft(msg, color='lime').text)
-            sys.stdout.flush()
-            if count >= total:
-                GLOBAL_COUNT = 0
-                print("") # Needed after completing job...
+def format_size(nbytes):
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if abs(nbytes) < 1024 or unit == 'TB':
+            break
+        nbytes /= 1024
+    return f"{nbytes:0.2f} {unit}" if unit != 'B' else f"{int(nbytes)} B"
+
+def progress(count, total, st, return_str=False, stdout=None, nbytes=0):
+    elapsed_time = time.perf_counter() - st
+    completed = count / total
+    completed_percent = completed * 100
+    eta = (100.0 * elapsed_time)/ completed_percent -  elapsed_time
+    latency = format_latency(elapsed_time/count)
+    eta_str = f'ETA: {format_time(eta)}'
+    elt_str = f'Elapsed-time: {format_time(elapsed_time)}'
+    msg = f"\r[ STATUS ] Progress: {completed:0.2%} | Processed: {count}/{total} | " \
+          f"{elt_str} | {eta_str} ~ {count/elapsed_time:0.1f} items/s @ {latency}"
+    if nbytes:
+        msg += f" | {format_size(nbytes)} ~ {format_size(nbytes/elapsed_time)}/s"
+    if return_str:
+        return msg
+    stdout = stdout or sys.stdout
+    stdout.write(ft(msg, color='lime').text)
+    stdout.flush()
+    if count >= total:
+        print("", file=stdout) # Needed after completing job...
+
+def _make_cache(cache: Union[bool, str, ResultCache, None]) -> Optional[ResultCache]:
+    # Checked first, an empty ResultCache is falsy...
+    if isinstance(cache, ResultCache):
+        return cache
+    if cache is None or cache is False or cache == '':
+        return None
+    return ResultCache(cache if isinstance(cache, str) else '')
+
+def _shard(data: Dict, total: int, shard_index: int, num_shards: int, shard_by: str='hash', keyfunc=item_key) -> Dict:
+    """Keeps the items of `data` that belong to shard `shard_index` out of `num_shards`."""
+    if num_shards < 1 or not 0 <= shard_index < num_shards:
+        raise ValueError(f"invalid shard [{shard_index}] of [{num_shards}], expected 0 <= shard_index < num_shards")
+    if shard_by == 'range':
+        indices = range(total * shard_index // num_shards, total * (shard_index + 1) // num_shards)
+    elif shard_by == 'hash':
+        indices = [i for i in range(total)
+                   if int(keyfunc({key: data[key][i] for key in data})[:15], 16) % num_shards == shard_index]
+    else:
+        raise ValueError(f"received invalid shard_by [{shard_by}], choose from [hash, range]")
+    return {key: [value[i] for i in indices] for key, value in data.items()}
+
+def _make_profile(profile: Union[bool, str, JobProfile, None]) -> Optional[JobProfile]:
+    if not profile:
+        return None
+    if isinstance(profile, JobProfile):
+        return profile
+    return JobProfile(profile if isinstance(profile, str) else '')
 
 def parallel_call(func):
-    def processor(*args, **kwargs):
-        global count, st
-        total = kwargs.get('total')
-        # Before call
-        func(*args, **kwargs)
+    def processor(job: Job, task: _Task, aid: int, *args, **kwargs):
+        _settle()
+        if not job.begin(task, aid):
+            return
+        switch(job.profiler)
+        if job.profiler is not None:
+            with job.profiler.item():
+                return _process(job, task, aid, *args, **kwargs)
+        return _process(job, task, aid, *args, **kwargs)
+
+    def _cached(job: Job, call: Callable, *args) -> Tuple[bool, Any]:
+        # A broken cache, e.g. a sqlite file locked by another process, must not lose the item...
+        try:
+            return call(*args)
+        except Exception as e:
+            with job._lock:
+                job.cache_errors += 1
+                job.cache_error = e
+            return False, None
+
+    def _process(job: Job, task: _Task, aid: int, *args, **kwargs):
+        _local.job = job
+        if job.cache is not None:
+            hit, _ = _cached(job, job.cache.get, task.key)
+            if hit:
+                job.finish(task, aid, hit=True)
+                return
+        try:
+            # Before call
+            resources = job.resources()
+            if resources:
+                kwargs = {**resources, **kwargs}
+            job._local.deferred = False
+            st, ct = time.perf_counter(), time.thread_time()
+            with job.running():
+                result = func(*args, **kwargs)
+        except Exception as e:
+            job.fail(task, aid, e)
+            return
         # After call
-        count += 1
-        progress(count, total, st)
+        latency = time.perf_counter() - st
+        if job.profiler is not None:
+            job.profiler.add_user(latency, time.thread_time() - ct)
+        if job.cache is not None and not task.done:
+            _cached(job, job.cache.set, task.key, result)
+        job.finish(task, aid, latency=latency, deferred=job._local.deferred)
 
-    @func_status
     def wrapper(*args, **kwargs):
         # Parallelize task...
-        global count, st
+        job = None
+        cache = None
+        coordinator = None
+        _verbose = kwargs.get('verbose')
+        stdout = sys.stdout if _is_verbose(_verbose) else _NullWriter()
+        print('********************* MultiThreading Start *********************', color='#FFFF99', file=stdout)
         try:
-            count = 0
             _data: Dict = kwargs.get('data')
             if not _data:
                 print("[  WARN  ] Recieved empty list or invalid argument. Make sure to "\
-                      "provide data as a kwarg [data=your_data_dict]. Early termination...", color='orange')
+                      "provide data as a kwarg [data=your_data_dict]. Early termination...", color='orange', file=stdout)
                 return
             total = len(list(_data.values())[0])
             _chunk_size = kwargs.get('chunk_size', min(5000, total))
@@ -165,31 +624,128 @@ def parallel_call(func):
                 if total != len(_data[key]):
                     raise Exception("Dictionary values are inconsistent. All values must have the same length...")
             # End of prechecks...
-            _data = _chunk_data(_data, _chunk_size)
+            num_shards = kwargs.get('num_shards', 1)
+            if num_shards > 1:
+                _data = _shard(_data, total, kwargs.get('shard_index', 0), num_shards,
+                               kwargs.get('shard_by', 'hash'), kwargs.get('cache_key') or item_key)
+                print(f"[  INFO  ] Shard {kwargs.get('shard_index', 0)}/{num_shards} holds "\
+                      f"{len(list(_data.values())[0])} of {total} items.", color='blue', file=stdout)
+                total = len(list(_data.values())[0])
+                if not total:
+                    return
+                _chunk_size = min(_chunk_size, total)
+            coordinator = kwargs.get('coordinator')
+            if coordinator is not None:
+                # Every worker must agree on the data, the first and last items make for a cheap fingerprint...
+                edges = [item_key({key: _data[key][i] for key in _data}) for i in (0, total - 1)]
+                coordinator.open(total, ':'.join(edges))
+            else:
+                _data = _chunk_data(_data, _chunk_size)
             _threads = kwargs.get('threads', -1) or kwargs.get('thread', -1)
             thread_limit = kwargs.get('thread_limit', 0)
             thread_count = (int(math.sqrt(total)) + 1) * int(math.log(total, 10)) if math.log(total, 10) >= 1 else 1
             thread = thread_count if _threads < 1 else _threads
             threads = min(4096, thread) if thread_limit == 0 else thread
-            print(f"[  INFO  ] Launching: {threads} threads...", color='blue')
-            st = time.perf_counter()
-            for chunk in _data:
-                chunk_size = len(list(chunk.values())[0])
-                with ThreadPoolExecutor(threads) as exe:
-                    # Iterate over data...
-                    for i in range(chunk_size):
-                        data = {key: list(chunk[key])[i] for key in chunk}
-                        exe.submit(processor, *args, data=data, total=total)
+            _pool: Union[bool, Executor, None] = kwargs.get('pool')
+            pool = shared_pool() if _pool is True else (_pool or None)
+            pool_size = kwargs.get('pool_size', 0) or (_SHARED_POOL_SIZE if pool is not None and pool is _SHARED_POOL else 0)
+            if pool_size > 0:
+                # More items in flight than the pool has workers would only queue up ahead of other jobs...
+                threads = min(threads, pool_size)
+            elif pool is not None:
+                print("[  WARN  ] size of the given pool is unknown, pass `pool_size` to cap in-flight items at it.",
+                      color='orange', file=stdout)
+            _cache = kwargs.get('cache')
+            cache = _make_cache(_cache)
+            dedupe = kwargs.get('dedupe', cache is not None)
+            keyfunc = kwargs.get('cache_key') or (cache.key if cache is not None else item_key)
+            seen = set()
+            job = Job(total, threads, verbose=_verbose, pool=pool, cache=cache,
+                      timeout=kwargs.get('timeout', 0), deadline=kwargs.get('deadline', 0),
+                      retries=kwargs.get('retries', 0), backoff=kwargs.get('backoff', 0),
+                      hedge=kwargs.get('hedge', False), init=kwargs.get('init'), teardown=kwargs.get('teardown'),
+                      profiler=_make_profile(kwargs.get('profile')))
+            job.print(f"[  INFO  ] Launching: {threads} threads...", color='blue')
+
+            def _launch(chunk: Dict, start: int, stop: int) -> bool:
+                # Iterate over data...
+                for i in range(start, stop):
+                    data = {key: chunk[key][i] for key in chunk}
+                    item = keyfunc(data) if (cache is not None or dedupe) else None
+                    if dedupe:
+                        # Duplicates collapse into the first occurrence...
+                        if item in seen:
+                            with job._lock:
+                                job.duplicates += 1
+                            job.step()
+                            continue
+                        seen.add(item)
+                    task = _Task(data, item, (processor, args, {'data': data, 'total': total}))
+                    if not job.launch(task):
+                        job.dropped = total - job.count - len(job._tasks)
+                        return False
+                return True
+
+            launched = True
+            if coordinator is not None:
+                while launched:
+                    batch = coordinator.claim()
+                    if batch is None:
+                        break
+                    with job.profiler.submitting() if job.profiler is not None else nullcontext():
+                        launched = _launch(_data, batch[1], batch[2])
+                    launched = launched and job.join()
+                    if launched:
+                        coordinator.complete(batch[0])
+            else:
+                with job.profiler.submitting() if job.profiler is not None else nullcontext():
+                    for chunk in _data:
+                        launched = _launch(chunk, 0, len(list(chunk.values())[0]))
+                        if not launched:
+                            break
+            if not job.join() or not launched:
+                print("", file=job.stdout)
+                job.print(f"[  WARN  ] Deadline of {format_time(job.deadline)} reached, dropped "\
+                          f"{job.dropped} unfinished item(s).", color='orange')
+            if job.deferred:
+                job.print(f"[  INFO  ] Deferred {job.deferred} item(s) to a follow-up job.", color='blue')
+            if job.hits or job.duplicates:
+                job.print(f"[  INFO  ] Skipped {job.hits} cached and {job.duplicates} duplicate item(s).", color='blue')
+            if job.timeouts or job.hedges:
+                job.print(f"[  INFO  ] {job.timeouts} attempt(s) timed out, {job.hedges} hedged attempt(s) launched.", color='blue')
+            if job.failed:
+                job.print(f"[  WARN  ] {job.failed} item(s) failed, last error: {job.error}.", color='orange')
+            if job.cache_errors:
+                job.print(f"[  WARN  ] {job.cache_errors} cache lookup(s) or write(s) failed and were skipped, "\
+                          f"last error: {job.cache_error}.", color='orange')
+            if job.profiler is not None:
+                for line in job.profiler.report(job.elapsed):
+                    job.print(line, color='cyan')
+                job.profiler.print_stats(job.stdout)
+            if coordinator is not None:
+                if launched and 0 < job.count < job.total:
+                    print("", file=job.stdout)
+                job.print(f"[  INFO  ] Worker [{coordinator.worker}] processed {job.count} item(s) "\
+                          f"in {coordinator.claimed} batch(es).", color='blue')
         except Exception as e:
-            print(f"[  ERROR ] {e}.", color='red')
+            print(f"[  ERROR ] {e}.", color='red', file=stdout)
             return
+        finally:
+            if job is not None:
+                job.close()
+            if coordinator is not None:
+                coordinator.leave()
+            if cache is not None and cache is not _cache:
+                cache.close()
+            print('********************* MultiThreading End *********************', color='#FFFF99', file=stdout)
+        return job
     return wrapper
 
 
 
 ################## READY TO GO FUNCTIONS START... ##################
-def mtdo(src_dir: str, dst_dir: str='', op: str='cp', file_type: str='*.*',
-         sep_folder: str='', overwrite: bool=False, prefix: str='', threads:int=8, **kwargs) -> None:
+def mtdo(src_dir: str, dst_dir: str='', op: str='cp', file_type: str='*.*', sep_folder: str='', overwrite: bool=False,
+         prefix: str='', threads:int=8, split_size: int=1 << 30, block_size: int=64 << 20, dry_run: bool=False, **kwargs) -> None:
     """Performs a multithreaded data operation.
 
     Args:
@@ -202,6 +758,12 @@ def mtdo(src_dir: str, dst_dir: str='', op: str='cp', file_type: str='*.*',
         overwrite (bool, optional): whether to overwrite data in destination or skip already copied data on later trials. Defaults to False.
         prefix (str): prefix for image renaming, e.g prefix=data and image_name=im.jpg --> data_im.jpg
         threads (int, optional): number of threads to launch. Defaults to 8.
+        split_size (int, optional): files larger than this many bytes are copied as concurrent byte ranges, 0 disables it. Defaults to 1 GB.
+        block_size (int, optional): size in bytes of each range of a split file. Defaults to 64 MB.
+        dry_run (bool, optional): for rm, only count the files and bytes that would be deleted. Defaults to False.
+        **kwargs: Extra keywords such as (chunk_size: split data into equal sized chunks, verbose: supress moethread stdout,
+                  num_shards/shard_index/shard_by: only process one shard of the data, coordinator: share batches with other workers),
+                  defaults to (chunk_size=5000, verbose=True, num_shards=1, shard_index=0, shard_by='hash')
     """
     error_color = 'red'
     op = op.lower()
@@ -210,7 +772,8 @@ def mtdo(src_dir: str, dst_dir: str='', op: str='cp', file_type: str='*.*',
     delete_op = ['del', 'delete', 'remove', 'rm']
     copy_op =  ['cp', 'copy']
     _dd = Path(dst_dir)
-    _dd.mkdir(exist_ok=True, parents=True)
+    if op not in delete_op:
+        _dd.mkdir(exist_ok=True, parents=True)
     valid_ops = rename_op + move_op + delete_op + copy_op
     if op in (move_op + copy_op + rename_op) and not os.path.isdir(dst_dir):
         if not dst_dir:
@@ -224,8 +787,28 @@ def mtdo(src_dir: str, dst_dir: str='', op: str='cp', file_type: str='*.*',
     if not prefix and op in rename_op:
         print(f"[  ERROR ] rename op [{op}] requires `prefix` to be provided.", color=error_color)
         return
+    # Sharded deletes still need the full file list, everything else streams the tree...
+    if op in delete_op and kwargs.get('num_shards', 1) <= 1 and kwargs.get('coordinator') is None:
+        if not os.path.isdir(src_dir):
+            print("[  ERROR ] source directory does not exist.", color=error_color)
+            return
+        _delete_tree(src_dir, file_type, threads, dry_run=dry_run, verbose=kwargs.get('verbose'))
+        return
 
-    data_paths = glob(os.path.join(src_dir, '**', file_type), recursive=True)
+    # Sorted, since glob order isn't stable and shards and coordinated batches rely on the order...
+    data_paths = sorted(glob(os.path.join(src_dir, '**', file_type), recursive=True))
+    coordinator = kwargs.get('coordinator')
+    sharded = kwargs.get('num_shards', 1) > 1
+    if sharded and kwargs.get('shard_by') == 'range' and op not in copy_op:
+        print(f"[  ERROR ] shard_by='range' needs every shard to see the same source files, which op [{op}] " \
+              f"removes, use shard_by='hash' instead.", color=error_color)
+        return
+    # Shards and coordinated workers must all split the same list, so what's already done is skipped per item...
+    per_item = coordinator is not None or sharded
+    if coordinator is not None:
+        # Sources vanish as files get moved and each worker sees a different destination, so coordinated
+        # workers share the list of the first worker to start and skip what is already done themselves...
+        data_paths = coordinator.share('mtdo', data_paths)
     if not data_paths:
         print(f"[  WARN  ] did not find any valid files of type [{file_type}] in source directory.", color='orange')
         return
@@ -234,7 +817,7 @@ def mtdo(src_dir: str, dst_dir: str='', op: str='cp', file_type: str='*.*',
               f"structure [{f'{os.sep}'.join(data_paths[0].split(os.sep)[:-1])}].", color='orange')
         print(f"[  WARN  ] will place data directly under [{dst_dir}]", color='orange')
         sep_folder = ''
-    if not overwrite:
+    if not overwrite and not per_item:
         dst_data_paths = glob(os.path.join(dst_dir, '**', file_type), recursive=True)
         dst_data = [_.split(os.sep)[-1] for _ in dst_data_paths]
         data_paths = [_ for _ in data_paths if _.split(os.sep)[-1] not in dst_data]
@@ -256,13 +839,266 @@ def mtdo(src_dir: str, dst_dir: str='', op: str='cp', file_type: str='*.*',
         _dst_dir.mkdir(parents=True, exist_ok=True)
         if prefix:
             filename = f'{prefix}_{filename}'
+        if per_item and op not in delete_op and not overwrite and os.path.exists(os.path.join(_dst_dir, filename)):
+            return # done by an earlier worker...
         if op in (move_op + rename_op):
             shutil.move(data_path, os.path.join(_dst_dir, filename))
         elif op in delete_op:
-            os.remove(data_path)
+            if not dry_run and (not per_item or os.path.exists(data_path)):
+                os.remove(data_path)
         else:
+            size = os.path.getsize(data_path)
+            if ranged and size > split_size:
+                # Large files are copied later on, split across all threads...
+                large_files.append((data_path, os.path.join(_dst_dir, filename), size))
+                current_job().defer()
+                return
             shutil.copyfile(data_path, os.path.join(_dst_dir, filename))
+            current_job().add_bytes(size)
+
+    large_files: List[Tuple[str, str, int]] = []
+    # Coordinated batches must be complete once their items return, so large files aren't deferred then...
+    ranged = op in copy_op and split_size > 0 and hasattr(os, 'pread') and coordinator is None
     _process_data(data={'data_path': data_paths}, threads=threads, **kwargs)
+    if large_files:
+        _ranged_copy(large_files, block_size, threads=threads, **kwargs)
+
+class _DeleteNode:
+    """A directory being emptied by `_delete_tree`."""
+    __slots__ = ('path', 'parent', 'fd', 'pending', 'open', 'keep')
+
+    def __init__(self, path: str, parent: Optional['_DeleteNode']=None):
+        self.path = path
+        self.parent = parent
+        self.fd: Optional[int] = None
+        self.pending = 1 # its own files plus each subdirectory...
+        self.open = 1    # its own scan plus each batch of files sharing `fd`...
+        self.keep = False
+
+def _delete_tree(src_dir: str, file_type: str='*.*', threads: int=8, dry_run: bool=False,
+                 batch_size: int=256, verbose: bool=True) -> Dict[str, int]:
+    """Deletes files matching `file_type` under `src_dir` in parallel, then prunes the directories left empty.
+
+    The tree is streamed with `os.scandir` instead of globbed upfront. Files are unlinked relative to an open directory fd
+    where the platform allows it, saving a full path lookup per file, and each directory is removed as soon as everything
+    below it is gone. At most `_DELETE_MAX_FDS` directories are held open at once, the others fall back to full paths. Like `glob`, hidden files and directories are left alone. `src_dir` itself is kept.
+
+    Args:
+        src_dir (str): directory to delete files from.
+        file_type (str, optional): pattern of files to delete. Defaults to all data types '*.*'.
+        threads (int, optional): number of threads to launch. Defaults to 8.
+        dry_run (bool, optional): only count what would be deleted. Defaults to False.
+        batch_size (int, optional): number of files of one directory unlinked per task. Defaults to 256.
+        verbose (bool, optional): whether to write status to stdout. Defaults to True.
+    """
+    stdout = sys.stdout if _is_verbose(verbose) else _NullWriter()
+    use_fd = os.scandir in os.supports_fd and os.unlink in os.supports_dir_fd
+    stats = {'files': 0, 'bytes': 0, 'dirs': 0, 'errors': 0}
+    errors: List[BaseException] = []
+    lock = threading.Lock()
+    idle = threading.Event()
+    outstanding = [0]
+    fds = threading.BoundedSemaphore(_DELETE_MAX_FDS)
+    exe = ThreadPoolExecutor(threads)
+
+    def _submit(fn, *args):
+        with lock:
+            outstanding[0] += 1
+        exe.submit(_run, fn, *args)
+
+    def _run(fn, *args):
+        try:
+            fn(*args)
+        finally:
+            with lock:
+                outstanding[0] -= 1
+                if outstanding[0] == 0:
+                    idle.set()
+
+    def _error(node: _DeleteNode, e: BaseException):
+        with lock:
+            node.keep = True
+            stats['errors'] += 1
+            errors.append(e)
+
+    def _scan(node: _DeleteNode):
+        names: List[Tuple[str, int]] = []
+        try:
+            # Never wait for a free fd here, the batches that would free one may be queued behind this scan...
+            if use_fd and fds.acquire(blocking=False):
+                try:
+                    node.fd = os.open(node.path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+                except OSError as e:
+                    fds.release()
+                    if e.errno not in (errno.EMFILE, errno.ENFILE):
+                        raise
+            with os.scandir(node.path if node.fd is None else node.fd) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        node.keep = True
+                    elif entry.is_dir(follow_symlinks=False):
+                        with lock:
+                            node.pending += 1
+                        _submit(_scan, _DeleteNode(os.path.join(node.path, entry.name), node))
+                    elif fnmatch(entry.name, file_type):
+                        names.append((entry.name, entry.stat(follow_symlinks=False).st_size))
+                        if len(names) >= batch_size:
+                            with lock:
+                                node.open += 1
+                            _submit(_unlink, node, names)
+                            names = []
+                    else:
+                        node.keep = True
+        except OSError as e:
+            _error(node, e)
+        _unlink(node, names)
+
+    def _unlink(node: _DeleteNode, names: List[Tuple[str, int]]):
+        files, nbytes = 0, 0
+        for name, size in names:
+            try:
+                if not dry_run:
+                    if node.fd is not None:
+                        os.unlink(name, dir_fd=node.fd)
+                    else:
+                        os.unlink(os.path.join(node.path, name))
+            except OSError as e:
+                _error(node, e)
+                continue
+            files += 1
+            nbytes += size
+        with lock:
+            stats['files'] += files
+            stats['bytes'] += nbytes
+            node.open -= 1
+            done = node.open == 0
+        if done:
+            if node.fd is not None:
+                os.close(node.fd)
+                node.fd = None
+                fds.release()
+            _release(node)
+
+    def _release(node: _DeleteNode):
+        # Walk up while each directory has nothing left below it...
+        while node.parent is not None:
+            with lock:
+                node.pending -= 1
+                if node.pending:
+                    return
+            if node.keep:
+                node.parent.keep = True
+            else:
+                try:
+                    if not dry_run:
+                        os.rmdir(node.path)
+                    with lock:
+                        stats['dirs'] += 1
+                except OSError as e:
+                    _error(node.parent, e)
+            node = node.parent
+        with lock:
+            node.pending -= 1
+
+    def _status() -> str:
+        elapsed = time.perf_counter() - st
+        verb = 'Would delete' if dry_run else 'Deleted'
+        return f"\r[ STATUS ] {verb}: {stats['files']} files | Freed: {format_size(stats['bytes'])} | " \
+               f"Pruned: {stats['dirs']} dirs | Elapsed-time: {format_time(elapsed)} ~ {stats['files']/elapsed:0.1f} files/s"
+
+    print('********************* MultiThreading Start *********************', color='#FFFF99', file=stdout)
+    print(f"[  INFO  ] {'Counting' if dry_run else 'Deleting'} [{file_type}] files under [{src_dir}] "\
+          f"with {threads} threads...", color='blue', file=stdout)
+    st = time.perf_counter()
+    _submit(_scan, _DeleteNode(src_dir))
+    while not idle.wait(0.5):
+        stdout.write(ft(_status(), color='lime').text)
+        stdout.flush()
+    exe.shutdown(wait=True)
+    stdout.write(ft(_status(), color='lime').text)
+    print("", file=stdout)
+    if errors:
+        print(f"[  WARN  ] {stats['errors']} file(s) or folder(s) could not be deleted, last error: {errors[-1]}.",
+              color='orange', file=stdout)
+    print('********************* MultiThreading End *********************', color='#FFFF99', file=stdout)
+    return stats
+
+def _ranged_copy(files: List[Tuple[str, str, int]], block_size: int, threads: int=8, **kwargs):
+    """Copies large files as byte ranges spread over many threads.
+
+    Ranges are written with `os.pwrite` into a `*.part` file sized upfront next to the destination,
+    which is renamed into place once all of its ranges landed.
+
+    Args:
+        files (List[Tuple[str, str, int]]): (source path, destination path, size in bytes) of each file.
+        block_size (int): size in bytes of each range.
+        threads (int, optional): number of threads to launch. Defaults to 8.
+    """
+    state: Dict[str, Dict] = {}
+    srcs, offsets, lengths = [], [], []
+    for src, dst, size in files:
+        state[src] = {'dst': dst, 'tmp': f'{dst}.part', 'size': size, 'fds': None, 'done': set(),
+                      'left': (size + block_size - 1) // block_size, 'lock': threading.Lock()}
+        for offset in range(0, size, block_size):
+            srcs.append(src)
+            offsets.append(offset)
+            lengths.append(min(block_size, size - offset))
+
+    def _open(entry: Dict, src: str):
+        if entry['fds'] is None:
+            sfd = os.open(src, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            dfd = os.open(entry['tmp'], os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            # Sizing the file is enough for pwrite, posix_fallocate falls back to writing every block on NFS or FUSE...
+            os.ftruncate(dfd, entry['size'])
+            entry['fds'] = (sfd, dfd)
+        return entry['fds']
+
+    def _close(entry: Dict):
+        if entry['fds'] is not None:
+            for fd in entry['fds']:
+                os.close(fd)
+            entry['fds'] = None
+
+    @parallel_call
+    def _copy_range(**kwargs):
+        data = kwargs.get('data', {})
+        src, offset = data['src'], data['offset']
+        entry = state[src]
+        end = offset + data['length']
+        with entry['lock']:
+            sfd, dfd = _open(entry, src)
+        while offset < end:
+            buf = os.pread(sfd, min(_COPY_BUFFER, end - offset), offset)
+            if not buf:
+                raise IOError(f"unexpected end of file [{src}]")
+            view, written = memoryview(buf), 0
+            while written < len(buf):
+                written += os.pwrite(dfd, view[written:], offset + written)
+            offset += len(buf)
+            current_job().add_bytes(len(buf))
+        with entry['lock']:
+            if data['offset'] in entry['done']:
+                return # a hedged attempt got here first...
+            entry['done'].add(data['offset'])
+            entry['left'] -= 1
+            if entry['left'] == 0:
+                _close(entry)
+                os.replace(entry['tmp'], entry['dst'])
+
+    if _is_verbose(kwargs.get('verbose')):
+        print(f"[  INFO  ] Copying {len(files)} large file(s) as {len(srcs)} ranges of {format_size(block_size)}...", color='blue')
+    # Ranges only make sense within this run, and the files were already sharded. Ranges share raw fds, so no
+    # attempt may outlive the job either: a timed out, hedged or dropped one could write into a reused fd...
+    for key in ['cache', 'coordinator', 'num_shards', 'shard_index', 'shard_by', 'timeout', 'hedge', 'deadline']:
+        kwargs.pop(key, None)
+    _copy_range(data={'src': srcs, 'offset': offsets, 'length': lengths}, threads=threads, **kwargs)
+    for src, entry in state.items():
+        if entry['left'] > 0:
+            with entry['lock']:
+                _close(entry)
+            if os.path.exists(entry['tmp']):
+                os.remove(entry['tmp'])
+            print(f"[  WARN  ] failed to copy [{src}], {entry['left']} range(s) did not complete.", color='orange')
 
 def mtdo_from_json(file_path: str, dst_dir: str, data_key: str,
                    label_key: str='', op:str='cp', threads:int=8, **kwargs):
@@ -274,7 +1110,9 @@ def mtdo_from_json(file_path: str, dst_dir: str, data_key: str,
         label_key (str): (optional) dictionary key holding labels for folders name to copy/move data to (classifying copied/moved data based on labels)
         op (str): operation type [cp: copy, mv: move].
         threads (int, optional): number of threads to launch. Defaults to 8.
-        **kwargs: Extra keywords such as (chunk_size: split data into equal sized chunks, verbose: supress moethread stdout), defaults to (chunk_size=5000, verbose=True)
+        **kwargs: Extra keywords such as (chunk_size: split data into equal sized chunks, verbose: supress moethread stdout,
+                  num_shards/shard_index/shard_by: only process one shard of the data, coordinator: share batches with other workers),
+                  defaults to (chunk_size=5000, verbose=True, num_shards=1, shard_index=0, shard_by='hash')
     """
     _mtdo_from_file(file_path, dst_dir, data_key, label_key, op, file_type='json', threads=threads, **kwargs)
 
@@ -288,7 +1126,9 @@ def mtdo_from_csv(file_path: str, dst_dir: str, data_key: str,
         label_key (str): (optional) dictionary key holding labels for folders name to copy/move data to (classifying copied/moved data based on labels)
         op (str): operation type [cp: copy, mv: move].
         threads (int, optional): number of threads to launch. Defaults to 8.
-        **kwargs: Extra keywords such as (chunk_size: split data into equal sized chunks, verbose: supress moethread stdout), defaults to (chunk_size=5000, verbose=True)
+        **kwargs: Extra keywords such as (chunk_size: split data into equal sized chunks, verbose: supress moethread stdout,
+                  num_shards/shard_index/shard_by: only process one shard of the data, coordinator: share batches with other workers),
+                  defaults to (chunk_size=5000, verbose=True, num_shards=1, shard_index=0, shard_by='hash')
     """
     _mtdo_from_file(file_path, dst_dir, data_key, label_key, op, file_type='csv', threads=threads, **kwargs)
 
@@ -304,7 +1144,9 @@ def _mtdo_from_file(file_path: str, dst_dir: str, data_key: str, label_key: str=
         op (str, optional): operation to carry on [copy `cp` or move `mv`]. Defaults to 'cp'.
         file_type (str, optional): Type of file to process [json or csv]. Defaults to 'json'.
         threads (int, optional): number of threads to launch. Defaults to 8.
-        **kwargs: Extra keywords such as (chunk_size: split data into equal sized chunks, verbose: supress moethread stdout), defaults to (chunk_size=5000, verbose=True)
+        **kwargs: Extra keywords such as (chunk_size: split data into equal sized chunks, verbose: supress moethread stdout,
+                  num_shards/shard_index/shard_by: only process one shard of the data, coordinator: share batches with other workers),
+                  defaults to (chunk_size=5000, verbose=True, num_shards=1, shard_index=0, shard_by='hash')
     """
     error_color = 'red'
     _dst_dir = Path(dst_dir)
@@ -333,6 +1175,8 @@ def _mtdo_from_file(file_path: str, dst_dir: str, data_key: str, label_key: str=
               f"cp (to copy), ren (to rename), rm (to delete)].", color=error_color)
         return
 
+    coordinator = kwargs.get('coordinator')
+
     @parallel_call
     def _process_data(**kwargs):
         url_idn = 'location='
@@ -344,6 +1188,8 @@ def _mtdo_from_file(file_path: str, dst_dir: str, data_key: str, label_key: str=
         if filename:
             dst_folder = Path(os.path.join(_dst_dir, subfolder))
             dst_folder.mkdir(parents=True, exist_ok=True)
+        if coordinator is not None and not os.path.exists(_path) and os.path.exists(os.path.join(dst_folder, filename)):
+            return # moved by an earlier worker...
         if op in ['mv', 'move']:
             shutil.move(_path, os.path.join(dst_folder, filename))
         else:
@@ -358,6 +1204,8 @@ def _mtdo_from_file(file_path: str, dst_dir: str, data_key: str, label_key: str=
         return
 
     data_paths = data[data_key]
+    # Manifests often list the same path more than once, and duplicates would race each other under `mv`...
+    kwargs.setdefault('dedupe', True)
     if label_key:
         labels = data[label_key]
         _process_data(data={'path': data_paths, 'label': labels}, threads=threads, **kwargs)
@@ -0,0 +1,161 @@
+import sys, time
+import queue, threading
+from typing import Callable, Dict, List, Optional
+from moecolor import print
+from moecolor import FormatText as ft
+from concurrent.futures import ProcessPoolExecutor
+from .main import _is_verbose, _NullWriter, format_time
+
+_DONE = object()
+
+
+class Stage:
+    """A single step of a `Pipeline`.
+
+    Args:
+        func (Callable): parallel_call style function, it receives the item through the `data` kwarg. Its return value,
+                         when not None, becomes the `data` passed to the next stage, otherwise `data` is forwarded as is.
+        workers (int, optional): number of workers for this stage. Defaults to 8.
+        backend (str, optional): where the stage runs [thread, process]. Process stages need a picklable, module level
+                                 function and must return their output since in-place changes to `data` are lost. Defaults to 'thread'.
+        queue_size (int, optional): capacity of the queue feeding this stage, 0 uses the pipeline's default. Defaults to 0.
+        name (str, optional): stage label in the progress output. Defaults to the function name.
+    """
+    def __init__(self, func: Callable, workers: int=8, backend: str='thread', queue_size: int=0, name: str=''):
+        backend = backend.lower()
+        if backend not in ['thread', 'process']:
+            raise ValueError(f"received invalid backend [{backend}], choose from [thread, process]")
+        self.func = func
+        self.workers = max(1, workers)
+        self.backend = backend
+        self.queue_size = queue_size
+        self.name = name or getattr(func, '__name__', 'stage')
+        self.count = 0
+        self.errors = 0
+        self.inbox: Optional[queue.Queue] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._alive = 0
+        self._lock = threading.Lock()
+
+    def status(self, elapsed: float) -> str:
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        depth = f"{self.inbox.qsize()}/{self.inbox.maxsize}" if self.inbox is not None else "-"
+        return f"{self.name}: {self.count} ~ {rate:0.1f} items/s q[{depth}]"
+
+
+class Pipeline:
+    """Runs items through a chain of stages linked by bounded queues.
+
+    Each stage has its own worker count and backend, so for example reads, decoding and writes can be sized
+    separately. A full queue blocks the stage feeding it, which keeps a slow stage from being buried in work.
+
+    Args:
+        stages (List[Stage]): stages to run, in order.
+        queue_size (int, optional): default capacity of the queues between stages. Defaults to 256.
+        interval (float, optional): seconds between progress updates. Defaults to 0.5.
+    """
+    def __init__(self, stages: List[Stage], queue_size: int=256, interval: float=0.5):
+        if not stages:
+            raise ValueError("pipeline requires at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.interval = interval
+        self.st = 0.0
+        self.stdout = sys.stdout
+
+    def _status(self, total: int) -> str:
+        elapsed = time.perf_counter() - self.st
+        stages = ' | '.join(stage.status(elapsed) for stage in self.stages)
+        return f"\r[ STATUS ] Processed: {self.stages[-1].count}/{total} | " \
+               f"Elapsed-time: {format_time(elapsed)} | {stages}"
+
+    def _report(self, total: int, stop: threading.Event):
+        while not stop.wait(self.interval):
+            self.stdout.write(ft(self._status(total), color='lime').text)
+            self.stdout.flush()
+
+    def _work(self, idx: int, args, total: int):
+        stage = self.stages[idx]
+        nxt = self.stages[idx + 1] if idx + 1 < len(self.stages) else None
+        while True:
+            data = stage.inbox.get()
+            if data is _DONE:
+                break
+            try:
+                if stage._pool is not None:
+                    result = stage._pool.submit(stage.func, *args, data=data, total=total).result()
+                else:
+                    result = stage.func(*args, data=data, total=total)
+            except Exception as e:
+                with stage._lock:
+                    stage.errors += 1
+                print(f"\n[  ERROR ] stage [{stage.name}] failed: {e}.", color='red', file=self.stdout)
+                continue
+            with stage._lock:
+                stage.count += 1
+            if nxt is not None:
+                nxt.inbox.put(data if result is None else result)
+        with stage._lock:
+            stage._alive -= 1
+            last = stage._alive == 0
+        if last and nxt is not None:
+            for _ in range(nxt.workers):
+                nxt.inbox.put(_DONE)
+
+    def __call__(self, *args, **kwargs):
+        _verbose = kwargs.get('verbose')
+        self.stdout = sys.stdout if _is_verbose(_verbose) else _NullWriter()
+        print('********************* Pipeline Start *********************', color='#FFFF99', file=self.stdout)
+        _data: Dict = kwargs.get('data')
+        if not _data:
+            print("[  WARN  ] Recieved empty list or invalid argument. Make sure to "\
+                  "provide data as a kwarg [data=your_data_dict]. Early termination...", color='orange', file=self.stdout)
+            print('********************* Pipeline End *********************', color='#FFFF99', file=self.stdout)
+            return
+        total = len(list(_data.values())[0])
+        for key in _data:
+            if total != len(_data[key]):
+                print("[  ERROR ] Dictionary values are inconsistent. All values must have the same length...",
+                      color='red', file=self.stdout)
+                print('********************* Pipeline End *********************', color='#FFFF99', file=self.stdout)
+                return
+        labels = {'thread': 'threads', 'process': 'processes'}
+        stages = ' -> '.join(f"{stage.name}[{stage.workers} {labels[stage.backend]}]" for stage in self.stages)
+        print(f"[  INFO  ] Launching pipeline: {stages}...", color='blue', file=self.stdout)
+        workers: List[threading.Thread] = []
+        stop = threading.Event()
+        reporter = threading.Thread(target=self._report, args=(total, stop), daemon=True)
+        try:
+            for idx, stage in enumerate(self.stages):
+                stage.count, stage.errors, stage._alive = 0, 0, stage.workers
+                stage.inbox = queue.Queue(stage.queue_size or self.queue_size)
+                if stage.backend == 'process':
+                    stage._pool = ProcessPoolExecutor(stage.workers)
+                for _ in range(stage.workers):
+                    workers.append(threading.Thread(target=self._work, args=(idx, args, total), daemon=True))
+            self.st = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            reporter.start()
+            head = self.stages[0]
+            for i in range(total):
+                head.inbox.put({key: _data[key][i] for key in _data})
+            for _ in range(head.workers):
+                head.inbox.put(_DONE)
+            for worker in workers:
+                worker.join()
+        finally:
+            stop.set()
+            if reporter.is_alive():
+                reporter.join()
+            for stage in self.stages:
+                if stage._pool is not None:
+                    stage._pool.shutdown(wait=True)
+                    stage._pool = None
+        self.stdout.write(ft(self._status(total), color='lime').text)
+        print("", file=self.stdout)
+        failed = sum(stage.errors for stage in self.stages)
+        if failed:
+            print(f"[  WARN  ] {failed} item(s) failed along the pipeline.", color='orange', file=self.stdout)
+        print('********************* Pipeline End *********************', color='#FFFF99', file=self.stdout)
+        return self
@@ -0,0 +1,169 @@
+import sys, time, cProfile
+import pstats, threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# From 3.12 on, a single profiler sees every thread and only one may be enabled per process...
+_PROCESS_WIDE = sys.version_info >= (3, 12)
+_active = threading.local()
+
+
+class JobProfile:
+    """Profiles every thread taking part in a `parallel_call` job and merges the results.
+
+    Before Python 3.12 a profiler only sees the thread it was enabled in, so each thread gets its own `cProfile.Profile`,
+    enabled on the thread's first item and kept on until another job takes over the thread. From 3.12 on, one profiler
+    covers the whole process from `start()` to `stop()`, including other jobs sharing the pool. Besides the merged
+    stats, the job's time is split between the user function and moethread's own per-item overhead, and the gap
+    between wall and thread CPU time is used to estimate how long threads sat waiting, e.g. on I/O or for the GIL.
+
+    Args:
+        path (str, optional): file to dump the merged stats to, viewable with `python -m pstats <path>`. Defaults to ''.
+        top (int, optional): number of functions listed in the printed report. Defaults to 15.
+    """
+    def __init__(self, path: str='', top: int=15):
+        self.path = path
+        self.top = top
+        self.stacks = True
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._profilers: List[cProfile.Profile] = []
+        self._timers: List[Dict[str, float]] = []
+        self._stopped = False
+
+    def _enable(self, profiler: cProfile.Profile) -> bool:
+        try:
+            profiler.enable()
+        except ValueError:
+            # Someone else is profiling already, keep timing only...
+            self.stacks = False
+            return False
+        with self._lock:
+            self._profilers.append(profiler)
+        return True
+
+    def _thread(self) -> Dict[str, float]:
+        timer = getattr(self._local, 'timer', None)
+        if timer is None:
+            timer = dict.fromkeys(['items', 'wall', 'cpu', 'user_wall', 'user_cpu', 'submit_wall', 'submit_cpu'], 0.0)
+            self._local.timer = timer
+            with self._lock:
+                self._timers.append(timer)
+            if not _PROCESS_WIDE and self.stacks and not self._stopped:
+                switch(None)
+                profiler = cProfile.Profile()
+                if self._enable(profiler):
+                    _active.profiler, _active.owner = profiler, self
+        return timer
+
+    def start(self):
+        """Starts the process-wide profiler on Pythons that have one, threads are picked up as they join otherwise."""
+        if _PROCESS_WIDE and self.stacks and not self._profilers:
+            self._enable(cProfile.Profile())
+
+    def stop(self):
+        """Stops profiling, can be called more than once."""
+        self._stopped = True
+        if _PROCESS_WIDE:
+            with self._lock:
+                profilers = list(self._profilers)
+            for profiler in profilers:
+                profiler.disable()
+        elif getattr(_active, 'owner', None) is self:
+            switch(None)
+
+    @contextmanager
+    def item(self):
+        """Times one item as run by a worker thread."""
+        timer = self._thread()
+        st, ct = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            timer['wall'] += time.perf_counter() - st
+            timer['cpu'] += time.thread_time() - ct
+            timer['items'] += 1
+
+    @contextmanager
+    def submitting(self):
+        """Times the thread handing items out to the workers."""
+        timer = self._thread()
+        st, ct = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            timer['submit_wall'] += time.perf_counter() - st
+            timer['submit_cpu'] += time.thread_time() - ct
+
+    def add_user(self, wall: float, cpu: float):
+        timer = self._thread()
+        timer['user_wall'] += wall
+        timer['user_cpu'] += cpu
+
+    def totals(self) -> Dict[str, float]:
+        with self._lock:
+            totals = dict.fromkeys(self._timers[0], 0.0) if self._timers else {}
+            for timer in self._timers:
+                for key, value in timer.items():
+                    totals[key] += value
+            totals['threads'] = sum(1 for timer in self._timers if timer['items'])
+        return totals
+
+    def stats(self, stream=None) -> Optional[pstats.Stats]:
+        with self._lock:
+            profilers = [profiler for profiler in self._profilers if profiler.getstats()]
+        if not profilers:
+            return None
+        stats = pstats.Stats(profilers[0], stream=stream)
+        for profiler in profilers[1:]:
+            stats.add(profiler)
+        return stats
+
+    def print_stats(self, stream=None):
+        """Prints the `top` functions of the merged stats by own time."""
+        stats = self.stats(stream) if self.stacks and self.top else None
+        if stats is not None:
+            stats.sort_stats('tottime').print_stats(self.top)
+
+    def report(self, elapsed: float) -> List[str]:
+        """Builds the summary lines, and dumps the merged stats to `path` if given."""
+        from .main import format_latency, format_time
+        self.stop()
+        totals = self.totals()
+        items = int(totals.get('items', 0))
+        if not items:
+            return []
+        overhead_wall = totals['wall'] - totals['user_wall']
+        overhead_cpu = totals['cpu'] - totals['user_cpu']
+        user_wait = 1 - totals['user_cpu'] / totals['user_wall'] if totals['user_wall'] > 0 else 0.0
+        overhead_wait = 1 - overhead_cpu / overhead_wall if overhead_wall > 0 else 0.0
+        busy = (totals['cpu'] + totals['submit_cpu']) / elapsed if elapsed > 0 else 0.0
+        lines = [
+            f"[ PROFILE ] {items} items on {int(totals['threads'])} worker thread(s) in {format_time(elapsed)}",
+            f"[ PROFILE ] User function: {format_latency(totals['user_wall'] / items)} wall, "
+            f"{format_latency(totals['user_cpu'] / items)} cpu, {user_wait:0.1%} off-cpu (I/O or GIL wait)",
+            f"[ PROFILE ] Moethread overhead: {format_latency(overhead_wall / items)} in workers + "
+            f"{format_latency(totals['submit_cpu'] / items)} submitting, {overhead_wait:0.1%} off-cpu (~GIL wait)",
+            f"[ PROFILE ] CPU parallelism: {busy:0.2f} cores busy on average",
+        ]
+        if not self.stacks:
+            lines.append("[ PROFILE ] Call stats are unavailable while another profiler is active, timings only.")
+        elif self.path:
+            stats = self.stats()
+            if stats is not None:
+                stats.dump_stats(self.path)
+                lines.append(f"[ PROFILE ] Stats written to [{self.path}], view with `python -m pstats {self.path}`")
+        return lines
+
+
+def switch(profile: Optional[JobProfile]):
+    """Stops the profiler a job left enabled on the calling thread, unless it belongs to `profile`.
+
+    Before Python 3.12 a profiler can only be disabled from its own thread, so pool threads keep the profiler of
+    the last profiled job they ran until they pick up an item of another job.
+    """
+    owner = getattr(_active, 'owner', None)
+    if owner is None or owner is profile:
+        return
+    _active.profiler.disable()
+    _active.profiler = _active.owner = None
@@ -0,0 +1,63 @@
+import queue, threading
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+
+class ResourcePool:
+    """Bounded pool of resources shared between threads, such as database connections.
+
+    Resources are built lazily with `factory`, at most `size` of them, and handed out one thread at a time.
+    A thread asking for one while all of them are in use waits for another thread to give one back.
+
+    Args:
+        factory (Callable): builds a new resource.
+        size (int, optional): maximum number of resources. Defaults to 8.
+        teardown (Callable, optional): called with every resource built once the pool is closed. Defaults to None.
+    """
+    def __init__(self, factory: Callable[[], Any], size: int=8, teardown: Optional[Callable[[Any], None]]=None):
+        self.factory = factory
+        self.size = max(1, size)
+        self.teardown = teardown
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._built: List = []
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float]=None):
+        """Lends a resource for the duration of the `with` block.
+
+        Args:
+            timeout (float, optional): seconds to wait for a free resource before raising `TimeoutError`. Defaults to waiting forever.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"no resource freed up within {timeout} seconds")
+        try:
+            resource = self._idle.get_nowait()
+        except queue.Empty:
+            try:
+                resource = self.factory()
+            except BaseException:
+                self._slots.release()
+                raise
+            with self._lock:
+                self._built.append(resource)
+        try:
+            yield resource
+        finally:
+            self._idle.put(resource)
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            built, self._built = self._built, []
+        self._idle = queue.LifoQueue()
+        if self.teardown is not None:
+            for resource in built:
+                self.teardown(resource)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,73 @@
+import os, sys, sqlite3
+sys.path.append('.')
+from moethread import parallel_call, ResultCache
+
+calls = []
+
+@parallel_call
+def double(**kwargs):
+    x = kwargs.get('data', {}).get('x')
+    calls.append(x)
+    return 2 * x
+
+def test_memory_cache_hits_and_dedupe():
+    calls.clear()
+    cache = ResultCache()
+    job = double(data={'x': [1, 1, 2, 3]}, threads=2, cache=cache, verbose=False)
+    assert sorted(calls) == [1, 2, 3]
+    assert job.duplicates == 1 and job.hits == 0
+    assert len(cache) == 3
+    calls.clear()
+    job = double(data={'x': [1, 2, 3, 4]}, threads=2, cache=cache, verbose=False)
+    assert calls == [4]
+    assert job.hits == 3 and job.count == 4
+
+def test_disk_cache_survives_across_runs(tmp_path):
+    path = os.path.join(tmp_path, 'results.db')
+    calls.clear()
+    cache = ResultCache(path)
+    double(data={'x': [1, 2, 3]}, threads=2, cache=cache, verbose=False)
+    cache.close()
+    assert sorted(calls) == [1, 2, 3]
+    calls.clear()
+    cache = ResultCache(path)
+    assert len(cache) == 3
+    assert cache.get(cache.key({'x': 2})) == (True, 4)
+    job = double(data={'x': [1, 2, 3, 4]}, threads=2, cache=cache, verbose=False)
+    cache.close()
+    assert calls == [4]
+    assert job.hits == 3
+
+def test_cache_eviction(tmp_path):
+    path = os.path.join(tmp_path, 'results.db')
+    cache = ResultCache(path, max_items=1, max_entries=2)
+    for i in range(5):
+        cache.set(str(i), i)
+    cache.evict()
+    assert len(cache) == 2
+    assert cache.get('4') == (True, 4)
+    cache.close()
+    cache = ResultCache(path, max_age=1e-9)
+    assert cache.get('4') == (False, None)
+    assert len(cache) == 0
+    cache.close()
+
+def test_dedupe_without_cache():
+    calls.clear()
+    job = double(data={'x': [5, 5, 5, 6]}, threads=2, dedupe=True, verbose=False)
+    assert sorted(calls) == [5, 6]
+    assert job.duplicates == 2 and job.count == 4
+
+class LockedCache(ResultCache):
+    def get(self, key):
+        raise sqlite3.OperationalError('database is locked')
+
+    def set(self, key, value):
+        raise sqlite3.OperationalError('database is locked')
+
+def test_cache_errors_do_not_lose_items():
+    calls.clear()
+    job = double(data={'x': [1, 2, 3]}, threads=2, cache=LockedCache(), verbose=False)
+    assert sorted(calls) == [1, 2, 3]
+    assert job.count == 3 and job.failed == 0
+    assert job.cache_errors == 6
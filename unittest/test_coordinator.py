@@ -0,0 +1,71 @@
+import os, sys, subprocess
+sys.path.append('.')
+from moethread import mtdo, Coordinator
+
+WORKER = """
+import os, sys
+sys.path.insert(0, {root!r})
+from moethread import parallel_call, Coordinator
+
+@parallel_call
+def touch(**kwargs):
+    i = kwargs.get('data', {{}}).get('i')
+    if os.environ.get('CRASH') and i == 25:
+        os._exit(1)
+    open(os.path.join({out!r}, str(i)), 'w').close()
+
+touch(data={{'i': list(range(100))}}, threads=2, verbose=False, coordinator=Coordinator({db!r}, batch_size=10, lease=1))
+"""
+
+def _worker(tmp_path, crash=False):
+    script = WORKER.format(root=os.getcwd(), out=os.path.join(tmp_path, 'out'), db=os.path.join(tmp_path, 'job.db'))
+    env = dict(os.environ, CRASH='1' if crash else '')
+    return subprocess.Popen([sys.executable, '-c', script], env=env)
+
+def test_late_workers_take_over_a_dead_worker(tmp_path):
+    os.makedirs(os.path.join(tmp_path, 'out'))
+    assert _worker(tmp_path, crash=True).wait() == 1
+    # The dead worker still holds a lease, late workers have to wait for it to expire...
+    workers = [_worker(tmp_path) for _ in range(2)]
+    assert [worker.wait(timeout=60) for worker in workers] == [0, 0]
+    assert sorted(os.listdir(os.path.join(tmp_path, 'out')), key=int) == [str(i) for i in range(100)]
+    coordinator = Coordinator(os.path.join(tmp_path, 'job.db'))
+    assert coordinator.pending() == 0
+    coordinator.close()
+
+class OneBatch(Coordinator):
+    def claim(self):
+        return super().claim() if not self.claimed else None
+
+def test_mtdo_move_resumes_on_another_worker(tmp_path):
+    src, dst, db = os.path.join(tmp_path, 'src'), os.path.join(tmp_path, 'dst'), os.path.join(tmp_path, 'job.db')
+    os.makedirs(src)
+    for i in range(20):
+        open(os.path.join(src, f'{i:02d}.txt'), 'w').close()
+    first = OneBatch(db, batch_size=5)
+    mtdo(src, dst, op='mv', file_type='*.txt', threads=2, coordinator=first, verbose=False)
+    first.close()
+    assert len(os.listdir(dst)) == 5
+    # The late worker sees fewer sources and some destinations already, but must run the same job...
+    second = Coordinator(db, batch_size=5)
+    mtdo(src, dst, op='mv', file_type='*.txt', threads=2, coordinator=second, verbose=False)
+    assert second.pending() == 0
+    second.close()
+    assert sorted(os.listdir(dst)) == [f'{i:02d}.txt' for i in range(20)]
+    assert not os.listdir(src)
+
+def test_reset_allows_reuse(tmp_path):
+    coordinator = Coordinator(os.path.join(tmp_path, 'job.db'), batch_size=4)
+    coordinator.open(8, 'a')
+    for _ in range(2):
+        coordinator.complete(coordinator.claim()[0])
+    assert coordinator.claim() is None
+    try:
+        coordinator.open(6, 'b')
+        assert False, 'a finished lease file must not accept a different job'
+    except ValueError:
+        pass
+    coordinator.reset()
+    coordinator.open(6, 'b')
+    assert coordinator.pending() == 2
+    coordinator.close()
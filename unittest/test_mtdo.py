@@ -0,0 +1,88 @@
+import os, sys, filecmp
+sys.path.append('.')
+from moethread import mtdo
+
+def _write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(os.urandom(size))
+
+def test_ranged_copy_of_large_files(tmp_path):
+    src, dst = os.path.join(tmp_path, 'src'), os.path.join(tmp_path, 'dst')
+    _write(os.path.join(src, 'a', 'big.bin'), 3 * 1024 * 1024 + 7)
+    _write(os.path.join(src, 'b', 'big2.bin'), 2 * 1024 * 1024)
+    _write(os.path.join(src, 'small.bin'), 1000)
+    # Straggler options must not leak into the ranged copy...
+    mtdo(src, dst, op='cp', file_type='*.bin', threads=4, split_size=1 << 20, block_size=256 << 10,
+         timeout=5, hedge=True, verbose=False)
+    assert sorted(os.listdir(dst)) == ['big.bin', 'big2.bin', 'small.bin']
+    assert filecmp.cmp(os.path.join(src, 'a', 'big.bin'), os.path.join(dst, 'big.bin'), shallow=False)
+    assert filecmp.cmp(os.path.join(src, 'b', 'big2.bin'), os.path.join(dst, 'big2.bin'), shallow=False)
+
+def _tree(root):
+    for path in ['a/b/c/1.txt', 'a/b/2.txt', 'a/3.txt', 'd/4.txt', 'd/e/5.txt', 'keep/6.log', 'f/.7.txt', '.g/8.txt']:
+        _write(os.path.join(root, path), 10)
+
+def _listing(root):
+    return sorted(os.path.relpath(os.path.join(d, name), root) for d, dirs, files in os.walk(root) for name in dirs + files)
+
+def test_delete_prunes_nested_folders(tmp_path):
+    src = os.path.join(tmp_path, 'src')
+    _tree(src)
+    mtdo(src, op='rm', file_type='*.txt', threads=4, verbose=False)
+    # Non matching and hidden files survive, along with the folders holding them...
+    assert _listing(src) == ['.g', os.path.join('.g', '8.txt'), 'f', os.path.join('f', '.7.txt'),
+                             'keep', os.path.join('keep', '6.log')]
+
+def test_delete_with_few_directory_fds(tmp_path, monkeypatch):
+    from moethread import main
+    monkeypatch.setattr(main, '_DELETE_MAX_FDS', 1)
+    src = os.path.join(tmp_path, 'src')
+    for i in range(20):
+        for j in range(5):
+            _write(os.path.join(src, str(i), str(j), 'x.txt'), 1)
+    stats = main._delete_tree(src, '*.txt', threads=8, batch_size=2, verbose=False)
+    assert stats['errors'] == 0 and stats['files'] == 100
+    assert os.listdir(src) == []
+
+def test_delete_dry_run_keeps_tree(tmp_path):
+    src = os.path.join(tmp_path, 'src')
+    _tree(src)
+    before = _listing(src)
+    mtdo(src, op='rm', file_type='*.txt', threads=4, dry_run=True, verbose=False)
+    assert _listing(src) == before
+
+def test_sharded_and_coordinated_delete(tmp_path):
+    from moethread import Coordinator
+    for name in ['sharded', 'coordinated']:
+        src = os.path.join(tmp_path, name)
+        _tree(src)
+        if name == 'sharded':
+            for index in range(2):
+                mtdo(src, op='rm', file_type='*.txt', threads=4, num_shards=2, shard_index=index, verbose=False)
+        else:
+            coordinator = Coordinator(os.path.join(tmp_path, 'job.db'), batch_size=2)
+            mtdo(src, op='rm', file_type='*.txt', threads=4, coordinator=coordinator, verbose=False)
+            coordinator.close()
+        files = [path for path in _listing(src) if os.path.isfile(os.path.join(src, path))]
+        assert sorted(files) == sorted([os.path.join('.g', '8.txt'), os.path.join('f', '.7.txt'), os.path.join('keep', '6.log')])
+
+def test_range_shards_copy_everything(tmp_path):
+    src, dst = os.path.join(tmp_path, 'src'), os.path.join(tmp_path, 'dst')
+    for i in range(10):
+        _write(os.path.join(src, f'{i}.txt'), 10)
+    # Shard 1 runs after shard 0 already filled part of the destination...
+    for index in range(2):
+        mtdo(src, dst, op='cp', file_type='*.txt', threads=2, num_shards=2, shard_index=index, shard_by='range', verbose=False)
+    assert sorted(os.listdir(dst)) == sorted(f'{i}.txt' for i in range(10))
+    mtdo(src, dst, op='mv', file_type='*.txt', threads=2, num_shards=2, shard_index=0, shard_by='range', verbose=False)
+    assert len(os.listdir(src)) == 10
+
+def test_deferred_items_are_not_counted():
+    from moethread import parallel_call, current_job
+    @parallel_call
+    def maybe_defer(**kwargs):
+        if kwargs.get('data', {}).get('x') % 2:
+            current_job().defer()
+    job = maybe_defer(data={'x': list(range(10))}, threads=2, verbose=False)
+    assert (job.count, job.deferred, job.total) == (5, 5, 5)
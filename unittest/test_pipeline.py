@@ -0,0 +1,55 @@
+import sys, time, threading
+sys.path.append('.')
+from moethread import Pipeline, Stage
+
+def add_one(**kwargs):
+    data = kwargs.get('data')
+    return {'x': data['x'] + 1}
+
+def double(**kwargs):
+    # Module level, so it can run in a process pool...
+    data = kwargs.get('data')
+    return {'x': data['x'] * 2}
+
+def _collect(out):
+    def collect(**kwargs):
+        out.append(kwargs.get('data')['x'])
+    return collect
+
+def test_single_workers_keep_order():
+    out = []
+    Pipeline([Stage(add_one, workers=1), Stage(double, workers=1), Stage(_collect(out), workers=1)])(data={'x': list(range(50))}, verbose=False)
+    assert out == [(x + 1) * 2 for x in range(50)]
+
+def test_thread_and_process_stages_are_complete():
+    out = []
+    pipe = Pipeline([Stage(add_one, workers=4), Stage(double, workers=2, backend='process'), Stage(_collect(out), workers=3)])
+    pipe(data={'x': list(range(200))}, verbose=False)
+    assert sorted(out) == [(x + 1) * 2 for x in range(200)]
+    assert [stage.count for stage in pipe.stages] == [200, 200, 200]
+
+def test_full_queue_blocks_the_stage_feeding_it():
+    lock = threading.Lock()
+    counts = {'fed': 0, 'taken': 0, 'ahead': 0}
+    def feed(**kwargs):
+        with lock:
+            counts['fed'] += 1
+            counts['ahead'] = max(counts['ahead'], counts['fed'] - counts['taken'])
+    def slow(**kwargs):
+        with lock:
+            counts['taken'] += 1
+        time.sleep(0.005)
+    Pipeline([Stage(feed, workers=1), Stage(slow, workers=1, queue_size=2)])(data={'x': list(range(60))}, verbose=False)
+    # Two queued, one being handed over and one being processed at most...
+    assert counts['ahead'] <= 4
+    assert counts['taken'] == 60
+
+def test_errors_are_counted_and_dropped():
+    out = []
+    def picky(**kwargs):
+        if kwargs.get('data')['x'] % 3 == 0:
+            raise ValueError('no multiples of three')
+    pipe = Pipeline([Stage(picky, workers=2), Stage(_collect(out), workers=2)])
+    pipe(data={'x': list(range(30))}, verbose=False)
+    assert pipe.stages[0].errors == 10 and pipe.stages[0].count == 20
+    assert sorted(out) == [x for x in range(30) if x % 3]
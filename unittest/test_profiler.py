@@ -0,0 +1,27 @@
+import os, sys, pstats
+sys.path.append('.')
+from moethread import parallel_call, shared_pool
+
+def work(n):
+    return sum(i * i for i in range(n))
+
+@parallel_call
+def compute(**kwargs):
+    work(kwargs.get('data', {}).get('n'))
+
+def _calls(stats):
+    return sum(value[1] for key, value in stats.stats.items() if key[2] == 'work')
+
+def test_profile_covers_every_worker(tmp_path):
+    path = os.path.join(tmp_path, 'job.prof')
+    job = compute(data={'n': [1000] * 40}, threads=4, profile=path, verbose=False)
+    assert job.profiler.stacks
+    assert _calls(pstats.Stats(path)) == 40
+    assert job.profiler.totals()['items'] == 40
+
+def test_profiles_on_shared_pool_stay_apart(tmp_path):
+    first = compute(data={'n': [1000] * 20}, threads=4, pool=shared_pool(), profile=True, verbose=False)
+    second = compute(data={'n': [1000] * 30}, threads=4, pool=shared_pool(), profile=True, verbose=False)
+    compute(data={'n': [1000] * 10}, threads=4, pool=shared_pool(), verbose=False)
+    assert _calls(first.profiler.stats()) == 20
+    assert _calls(second.profiler.stats()) == 30
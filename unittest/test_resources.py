@@ -0,0 +1,49 @@
+import sys, time, sqlite3, threading
+sys.path.append('.')
+from moethread import parallel_call, shared_pool
+
+@parallel_call
+def query(**kwargs):
+    kwargs.get('conn').execute("SELECT ?", (kwargs.get('data', {}).get('x'),))
+
+def _run(**kwargs):
+    built, closed = [], []
+    def init():
+        built.append(threading.get_ident())
+        return {'conn': sqlite3.connect(':memory:')}
+    def teardown(resources):
+        # sqlite connections can only be closed from the thread that opened them...
+        resources['conn'].close()
+        closed.append(threading.get_ident())
+    query(data={'x': list(range(200))}, threads=8, init=init, teardown=teardown, verbose=False, **kwargs)
+    return built, closed
+
+def test_teardown_runs_on_owning_threads():
+    built, closed = _run()
+    assert built and sorted(closed) == sorted(built)
+
+def _wait_for(condition, timeout=5):
+    st = time.perf_counter()
+    while not condition() and time.perf_counter() - st < timeout:
+        time.sleep(0.01)
+    return condition()
+
+def test_teardown_on_shared_pool():
+    built, closed = _run(pool=shared_pool())
+    # Shared pool threads tear down once they are free, which may be after the job returned...
+    assert built and _wait_for(lambda: sorted(closed) == sorted(built))
+
+@parallel_call
+def sleepy(**kwargs):
+    time.sleep(kwargs.get('data', {}).get('delay'))
+
+def test_teardown_does_not_wait_for_other_jobs():
+    pool = shared_pool()
+    other = threading.Thread(target=sleepy, kwargs={'data': {'delay': [1.5] * 4}, 'threads': 4, 'pool': pool, 'verbose': False})
+    other.start()
+    time.sleep(0.1)
+    st = time.perf_counter()
+    built, closed = _run(pool=pool)
+    assert time.perf_counter() - st < 1.0
+    other.join()
+    assert built and _wait_for(lambda: sorted(closed) == sorted(built))
@@ -0,0 +1,43 @@
+import sys, time, threading
+sys.path.append('.')
+from concurrent.futures import ThreadPoolExecutor
+from moethread import parallel_call, shared_pool
+
+lock = threading.Lock()
+flight = {'now': 0, 'peak': 0}
+
+@parallel_call
+def nap(**kwargs):
+    with lock:
+        flight['now'] += 1
+        flight['peak'] = max(flight['peak'], flight['now'])
+    time.sleep(0.01)
+    with lock:
+        flight['now'] -= 1
+
+def test_concurrent_jobs_keep_their_own_counters_and_output(capsys):
+    jobs = {}
+    def run(name, n, verbose):
+        jobs[name] = nap(data={'x': list(range(n))}, threads=4, pool=shared_pool(), verbose=verbose)
+    threads = [threading.Thread(target=run, args=('loud', 30, True)), threading.Thread(target=run, args=('quiet', 17, False))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print('still here')
+    out = capsys.readouterr().out
+    assert jobs['loud'].count == 30 and jobs['quiet'].count == 17
+    # The quiet job mutes only itself...
+    assert 'Processed: 30/30' in out and '/17' not in out
+    assert 'still here' in out
+
+def test_in_flight_items_capped_at_pool_size(capsys):
+    pool = ThreadPoolExecutor(3)
+    flight['peak'] = 0
+    nap(data={'x': list(range(30))}, threads=10, pool=pool, pool_size=3)
+    out = capsys.readouterr().out
+    assert flight['peak'] <= 3
+    assert 'Launching: 3 threads' in out
+    nap(data={'x': list(range(30))}, threads=10, pool=pool)
+    pool.shutdown()
+    assert 'pass `pool_size`' in capsys.readouterr().out
@@ -0,0 +1,57 @@
+import sys, time, threading
+sys.path.append('.')
+from concurrent.futures import ThreadPoolExecutor
+from moethread import parallel_call
+
+@parallel_call
+def sleepy(**kwargs):
+    time.sleep(kwargs.get('data', {}).get('delay'))
+
+def test_deadline_with_fast_items():
+    st = time.perf_counter()
+    job = sleepy(data={'delay': [0.01] * 1000}, threads=4, deadline=0.3, verbose=False)
+    elapsed = time.perf_counter() - st
+    assert elapsed < 1.0
+    assert job.count < 1000
+    assert job.count + job.dropped == 1000
+
+def test_timeout_ignores_time_spent_queued():
+    # Two jobs on a two worker pool keep items waiting in the executor queue...
+    pool = ThreadPoolExecutor(2)
+    jobs = []
+    def run():
+        jobs.append(sleepy(data={'delay': [0.1] * 12}, threads=2, pool=pool, timeout=0.25, verbose=False))
+    threads = [threading.Thread(target=run) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.shutdown()
+    assert [job.timeouts for job in jobs] == [0, 0]
+    assert [job.failed for job in jobs] == [0, 0]
+    assert [job.count for job in jobs] == [12, 12]
+
+def test_timeout_and_retry_of_hung_item():
+    attempts = {}
+    lock = threading.Lock()
+
+    @parallel_call
+    def flaky(**kwargs):
+        x = kwargs.get('data', {}).get('x')
+        with lock:
+            attempts[x] = attempts.get(x, 0) + 1
+            first = attempts[x] == 1
+        if x == 3 and first:
+            time.sleep(1.5) # hangs on its first attempt only...
+        if x == 5:
+            raise ValueError('always fails')
+
+    st = time.perf_counter()
+    job = flaky(data={'x': list(range(10))}, threads=4, timeout=0.3, retries=2, verbose=False)
+    assert time.perf_counter() - st < 1.2
+    assert job.count == 10
+    assert job.timeouts == 1
+    assert job.failed == 1
+    assert attempts[3] == 2
+    assert attempts[5] == 3
+    assert all(attempts[x] == 1 for x in range(10) if x not in (3, 5))